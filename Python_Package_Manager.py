@@ -7,10 +7,12 @@ with interactive menu, colorful output, and loading animations.
 import subprocess
 import sys
 import json
+import selectors
+import threading
 import time
 import os
-import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Tuple
 
 # Check if colorama is available, otherwise fallback to ANSI codes
@@ -21,6 +23,14 @@ try:
 except ImportError:
     COLORAMA_AVAILABLE = False
 
+# Use orjson for faster JSON parsing when available, otherwise use stdlib
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError, so except clauses
+# work unchanged)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 class Colors:
     """Color codes for terminal output."""
@@ -49,36 +59,50 @@ class Spinner:
     def __init__(self, message="Loading..."):
         self.message = message
         self.frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        self.running = False
         self.spinner_thread = None
         self.current_frame = 0
-        
+        self._stop_event = threading.Event()
+
     def spin(self):
         """Display the spinner animation."""
-        while self.running:
+        while not self._stop_event.is_set():
             frame = self.frames[self.current_frame]
-            sys.stdout.write(f"\r{Colors.PROCESSING}{frame} {self.message}{Colors.RESET}")
+            # Clear to end of line so a shorter message leaves no tail behind
+            sys.stdout.write(f"\r{Colors.PROCESSING}{frame} {self.message}{Colors.RESET}\x1b[K")
             sys.stdout.flush()
             self.current_frame = (self.current_frame + 1) % len(self.frames)
-            time.sleep(0.1)
-    
+            # wait() returns True as soon as stop() sets the event
+            if self._stop_event.wait(0.1):
+                break
+
     def start(self):
         """Start the spinner animation."""
-        self.running = True
-        import threading
+        self._stop_event.clear()
         self.spinner_thread = threading.Thread(target=self.spin)
         self.spinner_thread.daemon = True
         self.spinner_thread.start()
-    
+
     def stop(self):
         """Stop the spinner animation."""
-        self.running = False
+        self._stop_event.set()
         if self.spinner_thread:
             self.spinner_thread.join()
-        sys.stdout.write("\r" + " " * (len(self.message) + 2) + "\r")
+        # Erase the whole line; sizing the wipe to the current message would
+        # miss longer messages drawn earlier (e.g. streamed pip output)
+        sys.stdout.write("\r\x1b[K")
         sys.stdout.flush()
 
 
+def clear_screen() -> None:
+    """Clear the terminal without spawning a shell."""
+    if os.name == "nt" and not COLORAMA_AVAILABLE:
+        # Legacy Windows consoles don't understand ANSI escapes
+        os.system("cls")
+        return
+    sys.stdout.write("\x1b[H\x1b[2J")
+    sys.stdout.flush()
+
+
 def get_terminal_width() -> int:
     """Get the width of the terminal window."""
     try:
@@ -113,28 +137,27 @@ def print_header():
     print_centered(header, Colors.HEADER)
 
 
+# Color and glyph for each log level, looked up once per log call
+_LOG_LEVELS = {
+    "info": (Colors.INFO, "ℹ"),
+    "success": (Colors.SUCCESS, "✓"),
+    "warning": (Colors.WARNING, "⚠"),
+    "error": (Colors.ERROR, "✗"),
+    "processing": (Colors.PROCESSING, "⟳"),
+}
+
+
 def log(message: str, level: str = "info") -> None:
     """
     Log a message with the specified level and color.
-    
+
     Args:
         message: The message to log
         level: The log level (info, success, warning, error, processing)
     """
     timestamp = time.strftime("%H:%M:%S")
-    
-    if level == "info":
-        print(f"{Colors.INFO}[{timestamp}] ℹ {message}{Colors.RESET}")
-    elif level == "success":
-        print(f"{Colors.SUCCESS}[{timestamp}] ✓ {message}{Colors.RESET}")
-    elif level == "warning":
-        print(f"{Colors.WARNING}[{timestamp}] ⚠ {message}{Colors.RESET}")
-    elif level == "error":
-        print(f"{Colors.ERROR}[{timestamp}] ✗ {message}{Colors.RESET}")
-    elif level == "processing":
-        print(f"{Colors.PROCESSING}[{timestamp}] ⟳ {message}{Colors.RESET}")
-    else:
-        print(f"[{timestamp}] {message}")
+    color, glyph = _LOG_LEVELS.get(level, ("", "·"))
+    sys.stdout.write(f"{color}[{timestamp}] {glyph} {message}{Colors.RESET}\n")
 
 
 def run_command(command: List[str], timeout: int = 120) -> Dict[str, Any]:
@@ -149,57 +172,216 @@ def run_command(command: List[str], timeout: int = 120) -> Dict[str, Any]:
         Dictionary containing stdout, stderr, and return code
     """
     result = {"success": False, "stdout": "", "stderr": "", "returncode": -1}
-    
+
+    try:
+        # subprocess.run handles the timeout kill+wait itself, so a timed-out
+        # child can't be left behind as a zombie
+        completed = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+
+        result["stdout"] = completed.stdout
+        result["stderr"] = completed.stderr
+        result["returncode"] = completed.returncode
+        result["success"] = completed.returncode == 0
+
+    except subprocess.TimeoutExpired:
+        log(f"Command timed out after {timeout} seconds: {' '.join(command)}", "error")
+    except Exception as e:
+        log(f"Error running command: {e}", "error")
+
+    return result
+
+
+def _stream_process(command: List[str], timeout: int,
+                    on_stdout=None) -> Dict[str, Any]:
+    """
+    Run a command, polling its pipes with selectors under a hard deadline.
+
+    Shared engine for run_command_streaming and run_command_with_progress:
+    both pipes are drained as data arrives (so neither can fill and stall
+    the child), and the deadline is checked every poll interval, so even a
+    completely silent child still times out. POSIX only - callers fall back
+    to run_command on Windows, where select can't watch pipes.
+
+    Args:
+        command: The command to run as a list of strings
+        timeout: Maximum time in seconds to wait for the command to complete
+        on_stdout: Optional callback receiving each stdout chunk as bytes
+
+    Returns:
+        Dictionary containing stdout, stderr, and return code
+    """
+    result = {"success": False, "stdout": "", "stderr": "", "returncode": -1}
+    process = None
+    selector = None
+
     try:
         process = subprocess.Popen(
             command,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.PIPE
         )
-        
-        stdout, stderr = process.communicate(timeout=timeout)
-        
-        result["stdout"] = stdout
-        result["stderr"] = stderr
+
+        buffers = {process.stdout: [], process.stderr: []}
+        selector = selectors.DefaultSelector()
+        for pipe in buffers:
+            os.set_blocking(pipe.fileno(), False)
+            selector.register(pipe, selectors.EVENT_READ)
+
+        deadline = time.monotonic() + timeout
+        while selector.get_map():
+            for key, _ in selector.select(timeout=0.1):
+                data = os.read(key.fileobj.fileno(), 65536)
+                if not data:
+                    # EOF on this pipe
+                    selector.unregister(key.fileobj)
+                    continue
+                buffers[key.fileobj].append(data)
+                if key.fileobj is process.stdout and on_stdout:
+                    on_stdout(data)
+
+            if time.monotonic() > deadline:
+                process.kill()
+                process.wait()
+                log(f"Command timed out after {timeout} seconds: {' '.join(command)}", "error")
+                return result
+
+        process.wait(timeout=max(0, deadline - time.monotonic()))
+
+        result["stdout"] = b"".join(buffers[process.stdout]).decode(errors="replace")
+        result["stderr"] = b"".join(buffers[process.stderr]).decode(errors="replace")
         result["returncode"] = process.returncode
         result["success"] = process.returncode == 0
-        
+
     except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
         log(f"Command timed out after {timeout} seconds: {' '.join(command)}", "error")
-        try:
-            process.kill()
-        except Exception as e:
-            log(f"Failed to kill process: {e}", "error")
     except Exception as e:
         log(f"Error running command: {e}", "error")
-        
+    finally:
+        if selector is not None:
+            selector.close()
+        if process is not None:
+            process.stdout.close()
+            process.stderr.close()
+
     return result
 
 
-def get_pip_path() -> Optional[str]:
+def run_command_streaming(command: List[str], timeout: int = 120,
+                          on_chunk=None) -> Dict[str, Any]:
     """
-    Find the path to the pip executable being used.
-    
+    Run a command, consuming its stdout incrementally as it arrives.
+
+    Unlike run_command, output is read as it is produced and on_chunk is
+    called with the total bytes received so far. Used for "pip list" calls
+    whose output can be large, so the spinner can show progress instead of
+    sitting silent until the child exits. Falls back to run_command on
+    Windows, where select can't watch pipes.
+
+    Args:
+        command: The command to run as a list of strings
+        timeout: Maximum time in seconds to wait for the command to complete
+        on_chunk: Optional callback receiving the running byte count
+
     Returns:
-        Path to pip executable or None if not found
+        Dictionary containing stdout, stderr, and return code
     """
+    if os.name == "nt":
+        return run_command(command, timeout)
+
+    received = 0
+
+    def count_bytes(data):
+        nonlocal received
+        received += len(data)
+        if on_chunk:
+            on_chunk(received)
+
+    return _stream_process(command, timeout, on_stdout=count_bytes)
+
+
+def run_command_with_progress(command: List[str], timeout: int = 120,
+                              spinner: Optional[Spinner] = None) -> Dict[str, Any]:
+    """
+    Run a command, mirroring its latest output line into a spinner message.
+
+    Instead of blocking in communicate() until the child exits, this polls
+    the child's pipes at ~10 Hz and pushes the most recent non-empty stdout
+    line (e.g. "Collecting numpy...") into the spinner, so long pip installs
+    show real progress. Falls back to run_command on Windows, where select
+    can't watch pipes, or when no spinner is given.
+
+    Args:
+        command: The command to run as a list of strings
+        timeout: Maximum time in seconds to wait for the command to complete
+        spinner: Spinner whose message should track the command's output
+
+    Returns:
+        Dictionary containing stdout, stderr, and return code
+    """
+    if os.name == "nt" or spinner is None:
+        return run_command(command, timeout)
+
+    base_message = spinner.message
+
+    def show_line(data):
+        # Surface the latest non-empty line as progress
+        for line in reversed(data.decode(errors="replace").splitlines()):
+            line = line.strip()
+            if line:
+                spinner.message = line[:60]
+                break
+
+    try:
+        return _stream_process(command, timeout, on_stdout=show_line)
+    finally:
+        spinner.message = base_message
+
+
+# Cache for get_pip_path - the working pip command never changes mid-session
+_PIP_CMD_CACHE: Optional[List[str]] = None
+
+# Short-lived cache of parsed "pip list" output, keyed on the command.
+# Cleared whenever packages are installed or removed.
+_LIST_CACHE: Dict[Tuple[str, ...], Tuple[float, List[Dict[str, str]]]] = {}
+_LIST_CACHE_TTL = 30  # seconds
+
+
+def get_pip_path() -> Optional[List[str]]:
+    """
+    Find the pip command being used, as an argv prefix.
+
+    The result is cached after the first successful probe so repeated menu
+    actions don't re-spawn "pip --version" subprocesses. Returning the
+    already-tokenized prefix lets call sites build commands with a plain
+    list concatenation instead of re-splitting a string each time.
+
+    Returns:
+        Argv prefix such as [sys.executable, "-m", "pip"] or None if not found
+    """
+    global _PIP_CMD_CACHE
+    if _PIP_CMD_CACHE is not None:
+        return _PIP_CMD_CACHE
+
     spinner = Spinner("Locating pip executable")
     spinner.start()
-    
-    # Try different pip commands to find one that works
-    for pip_cmd in ["pip", "pip3", sys.executable + " -m pip"]:
-        if " " in pip_cmd:
-            cmd = pip_cmd.split() + ["--version"]
-        else:
-            cmd = [pip_cmd, "--version"]
-            
-        result = run_command(cmd)
+
+    # Try different pip commands to find one that works; "python -m pip"
+    # goes first since it is the most reliable and avoids failed probes
+    for pip_cmd in [[sys.executable, "-m", "pip"], ["pip"], ["pip3"]]:
+        result = run_command(pip_cmd + ["--version"])
         if result["success"]:
             spinner.stop()
-            log(f"Using {pip_cmd}: {result['stdout'].strip()}")
+            log(f"Using {' '.join(pip_cmd)}: {result['stdout'].strip()}")
+            _PIP_CMD_CACHE = pip_cmd
             return pip_cmd
-    
+
     spinner.stop()
     log("Could not find pip. Please ensure pip is installed.", "error")
     return None
@@ -215,28 +397,34 @@ def get_outdated_packages() -> List[Dict[str, str]]:
     pip_cmd = get_pip_path()
     if not pip_cmd:
         return []
-        
+
+    cmd = pip_cmd + ["list", "--outdated", "--format=json"]
+
+    cache_key = tuple(cmd)
+    cached = _LIST_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _LIST_CACHE_TTL:
+        return cached[1]
+
     spinner = Spinner("Checking for outdated packages")
     spinner.start()
-    
-    if " " in pip_cmd:
-        cmd = pip_cmd.split() + ["list", "--outdated", "--format=json"]
-    else:
-        cmd = [pip_cmd, "list", "--outdated", "--format=json"]
-        
-    result = run_command(cmd)
+
+    def show_progress(received):
+        spinner.message = f"Checking for outdated packages ({received // 1024} KB)"
+
+    result = run_command_streaming(cmd, on_chunk=show_progress)
     spinner.stop()
-    
+
     if not result["success"]:
         log(f"Failed to get outdated packages: {result['stderr']}", "error")
         return []
-    
+
     try:
-        outdated = json.loads(result["stdout"])
+        outdated = _json_loads(result["stdout"])
         if outdated:
             log(f"Found {len(outdated)} outdated package(s)", "info")
         else:
             log("All packages are up to date!", "success")
+        _LIST_CACHE[cache_key] = (time.monotonic(), outdated)
         return outdated
     except json.JSONDecodeError:
         log(f"Failed to parse pip output: {result['stdout']}", "error")
@@ -253,95 +441,71 @@ def get_installed_packages() -> List[Dict[str, str]]:
     pip_cmd = get_pip_path()
     if not pip_cmd:
         return []
-        
+
+    cmd = pip_cmd + ["list", "--format=json"]
+
+    cache_key = tuple(cmd)
+    cached = _LIST_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _LIST_CACHE_TTL:
+        return cached[1]
+
     spinner = Spinner("Getting installed packages")
     spinner.start()
-    
-    if " " in pip_cmd:
-        cmd = pip_cmd.split() + ["list", "--format=json"]
-    else:
-        cmd = [pip_cmd, "list", "--format=json"]
-        
-    result = run_command(cmd)
+
+    def show_progress(received):
+        spinner.message = f"Getting installed packages ({received // 1024} KB)"
+
+    result = run_command_streaming(cmd, on_chunk=show_progress)
     spinner.stop()
-    
+
     if not result["success"]:
         log(f"Failed to get installed packages: {result['stderr']}", "error")
         return []
-    
+
     try:
-        packages = json.loads(result["stdout"])
+        packages = _json_loads(result["stdout"])
         if packages:
             log(f"Found {len(packages)} installed package(s)", "info")
         else:
             log("No packages are installed!", "warning")
+        _LIST_CACHE[cache_key] = (time.monotonic(), packages)
         return packages
     except json.JSONDecodeError:
         log(f"Failed to parse pip output: {result['stdout']}", "error")
         return []
 
 
-def update_package(package_name: str, pip_cmd: str) -> Tuple[bool, str]:
+def parse_installed_names(stdout: str) -> set:
     """
-    Update a single package to the latest version.
-    
-    Args:
-        package_name: Name of the package to update
-        pip_cmd: The pip command to use
-        
-    Returns:
-        Tuple of (success, output)
-    """
-    spinner = Spinner(f"Updating {package_name}")
-    spinner.start()
-    
-    if " " in pip_cmd:
-        cmd = pip_cmd.split() + ["install", "--upgrade", package_name]
-    else:
-        cmd = [pip_cmd, "install", "--upgrade", package_name]
-        
-    result = run_command(cmd, timeout=300)  # Allow longer timeout for installations
-    spinner.stop()
-    
-    if result["success"]:
-        # Extract version from pip output
-        version_info = ""
-        for line in result["stdout"].splitlines():
-            if "Successfully installed" in line:
-                version_info = line.strip()
-                break
-        
-        return True, version_info
-    else:
-        return False, result["stderr"]
+    Parse the package names pip reports as installed or already current.
 
+    Covers both "Successfully installed ..." and "Requirement already
+    satisfied: ..." lines - the latter appears when a package was upgraded
+    earlier in the same run (e.g. as a dependency of another batch member)
+    and is just as up to date.
 
-def remove_package(package_name: str, pip_cmd: str) -> Tuple[bool, str]:
-    """
-    Remove a package.
-    
     Args:
-        package_name: Name of the package to remove
-        pip_cmd: The pip command to use
-        
+        stdout: Captured stdout from a pip install run
+
     Returns:
-        Tuple of (success, output)
+        Set of normalized (lowercase, dashed) package names that pip installed
     """
-    spinner = Spinner(f"Removing {package_name}")
-    spinner.start()
-    
-    if " " in pip_cmd:
-        cmd = pip_cmd.split() + ["uninstall", "-y", package_name]
-    else:
-        cmd = [pip_cmd, "uninstall", "-y", package_name]
-        
-    result = run_command(cmd, timeout=120)
-    spinner.stop()
-    
-    if result["success"]:
-        return True, result["stdout"]
-    else:
-        return False, result["stderr"]
+    installed = set()
+    for line in stdout.splitlines():
+        line = line.strip()
+        if line.startswith("Successfully installed"):
+            for token in line.split()[2:]:
+                # Tokens look like "requests-2.31.0"; drop the version suffix
+                name = token.rsplit("-", 1)[0]
+                installed.add(name.lower().replace("_", "-"))
+        elif line.startswith("Requirement already satisfied:"):
+            # e.g. "Requirement already satisfied: requests in /usr/... (2.31.0)"
+            name = line.split()[3]
+            # Dependency requirements can carry version specifiers or extras
+            for sep in "<>=!~;[(":
+                name = name.split(sep, 1)[0]
+            installed.add(name.lower().replace("_", "-"))
+    return installed
 
 
 def display_packages(packages: List[Dict[str, str]], title: str) -> None:
@@ -361,25 +525,34 @@ def display_packages(packages: List[Dict[str, str]], title: str) -> None:
     print(f"\n{Colors.BOLD}{title}{Colors.RESET}")
     print("─" * terminal_width)
     
-    # Determine column widths
-    name_width = max([len(pkg["name"]) for pkg in packages] + [10])
-    version_width = max([len(pkg.get("version", "")) for pkg in packages] + [10])
-    
+    # Determine both column widths in a single pass over the packages
+    name_width = 10
+    version_width = 10
+    for pkg in packages:
+        name_len = len(pkg["name"])
+        version_len = len(pkg.get("version", ""))
+        if name_len > name_width:
+            name_width = name_len
+        if version_len > version_width:
+            version_width = version_len
+
     # Header
     print(f"{Colors.BOLD}{'#':<4} {'Package Name':<{name_width}} {'Version':<{version_width}} Description{Colors.RESET}")
     print("─" * terminal_width)
     
-    # Package rows
+    # Package rows, joined and written in one go to avoid a flush per row
+    rows = []
     for i, pkg in enumerate(packages):
         name = pkg["name"]
         version = pkg.get("version", "N/A")
         description = pkg.get("latest_version", "") if "latest_version" in pkg else ""
-        
+
         if not description and "summary" in pkg:
             description = pkg["summary"][:terminal_width - name_width - version_width - 10]
-            
-        print(f"{i+1:<4} {name:<{name_width}} {version:<{version_width}} {description}")
-    
+
+        rows.append(f"{i+1:<4} {name:<{name_width}} {version:<{version_width}} {description}")
+
+    sys.stdout.write("\n".join(rows) + "\n")
     print("─" * terminal_width)
 
 
@@ -399,23 +572,27 @@ def display_outdated_packages(packages: List[Dict[str, str]]) -> None:
     print(f"\n{Colors.BOLD}OUTDATED PACKAGES{Colors.RESET}")
     print("─" * terminal_width)
     
-    # Determine column widths
-    name_width = max([len(pkg["name"]) for pkg in packages] + [10])
+    # Determine column widths without building an intermediate list
+    name_width = max((len(pkg["name"]) for pkg in packages), default=10)
+    if name_width < 10:
+        name_width = 10
     version_width = 10
     
     # Header
     print(f"{Colors.BOLD}{'#':<4} {'Package Name':<{name_width}} {'Current':<{version_width}} {'Latest':<{version_width}} Description{Colors.RESET}")
     print("─" * terminal_width)
     
-    # Package rows
+    # Package rows, joined and written in one go to avoid a flush per row
+    rows = []
     for i, pkg in enumerate(packages):
         name = pkg["name"]
         current = pkg.get("version", "N/A")
         latest = pkg.get("latest_version", "N/A")
         summary = pkg.get("summary", "")[:terminal_width - name_width - version_width*2 - 15]
-            
-        print(f"{i+1:<4} {name:<{name_width}} {current:<{version_width}} {latest:<{version_width}} {summary}")
-    
+
+        rows.append(f"{i+1:<4} {name:<{name_width}} {current:<{version_width}} {latest:<{version_width}} {summary}")
+
+    sys.stdout.write("\n".join(rows) + "\n")
     print("─" * terminal_width)
 
 
@@ -428,22 +605,26 @@ def display_summary(successful: List[str], failed: List[str]) -> None:
         failed: List of packages that failed to update
     """
     terminal_width = get_terminal_width()
-    
+
     print("\n" + "─" * terminal_width)
     print(f"{Colors.BOLD}PACKAGE UPDATE SUMMARY{Colors.RESET}")
     print("─" * terminal_width)
-    
+
+    success_count = len(successful)
+    failure_count = len(failed)
+    total = success_count + failure_count
+
     if successful:
-        print(f"\n{Colors.SUCCESS}✓ Successfully updated ({len(successful)}):{Colors.RESET}")
+        print(f"\n{Colors.SUCCESS}✓ Successfully updated ({success_count}):{Colors.RESET}")
         for pkg in successful:
             print(f"  • {pkg}")
-    
+
     if failed:
-        print(f"\n{Colors.ERROR}✗ Failed to update ({len(failed)}):{Colors.RESET}")
+        print(f"\n{Colors.ERROR}✗ Failed to update ({failure_count}):{Colors.RESET}")
         for pkg in failed:
             print(f"  • {pkg}")
-    
-    success_rate = len(successful) / (len(successful) + len(failed)) * 100 if successful or failed else 100
+
+    success_rate = (success_count / total * 100) if total else 100.0
     print("\n" + "─" * terminal_width)
     print(f"Update completion rate: {success_rate:.1f}%")
     print("─" * terminal_width)
@@ -483,33 +664,72 @@ def update_all_packages() -> None:
     # Track results
     successful_updates = []
     failed_updates = []
-    
-    # Update each package
+
+    # Update all packages in as few pip invocations as possible; each pip
+    # startup re-resolves the environment, so batching amortizes that cost
+    separator = "─" * get_terminal_width()
     print(f"\n{Colors.BOLD}UPDATING PACKAGES{Colors.RESET}")
-    print("─" * get_terminal_width())
-    
+    print(separator)
+
+    names = [package_info["name"] for package_info in outdated_packages]
+    chunk_size = 50  # Stay well under OS argument-length limits
+
+    spinner = Spinner(f"Updating {len(names)} package(s)")
+    spinner.start()
+
+    installed = set()
+    retry_names = []
+    for start in range(0, len(names), chunk_size):
+        chunk = names[start:start + chunk_size]
+        cmd = pip_cmd + ["install", "--upgrade"] + chunk
+
+        result = run_command_with_progress(cmd, timeout=300 + 30 * len(chunk), spinner=spinner)
+        installed.update(parse_installed_names(result["stdout"]))
+        # Retry any member pip didn't account for, whatever the chunk's exit
+        # status - a failed batch doesn't say which package broke it
+        retry_names.extend(
+            name for name in chunk
+            if name.lower().replace("_", "-") not in installed
+        )
+
+    spinner.stop()
+
+    # Retry failures one package at a time, in parallel - each worker just
+    # blocks on a pip subprocess, so a small thread pool overlaps them
+    errors = {}
+    if retry_names:
+        def retry_update(name):
+            return name, run_command(pip_cmd + ["install", "--upgrade", name], timeout=300)
+
+        spinner = Spinner(f"Retrying {len(retry_names)} package(s) individually")
+        spinner.start()
+        with ThreadPoolExecutor(max_workers=min(4, len(retry_names))) as executor:
+            futures = [executor.submit(retry_update, name) for name in retry_names]
+            for future in as_completed(futures):
+                name, result = future.result()
+                if result["success"]:
+                    installed.update(parse_installed_names(result["stdout"]))
+                else:
+                    errors[name.lower().replace("_", "-")] = result["stderr"].strip()
+        spinner.stop()
+
+    _LIST_CACHE.clear()
+
     for package_info in outdated_packages:
         package_name = package_info["name"]
         current_version = package_info["version"]
         latest_version = package_info["latest_version"]
-        
-        log(f"Package: {package_name} (Current: {current_version}, Latest: {latest_version})", "processing")
-        
-        # Add a small delay between package installations to avoid race conditions
-        if outdated_packages.index(package_info) > 0:
-            time.sleep(1)
-            
-        success, output = update_package(package_name, pip_cmd)
-        
-        if success:
+
+        if package_name.lower().replace("_", "-") in installed:
             successful_updates.append(f"{package_name} ({current_version} → {latest_version})")
             log(f"Updated {package_name} to {latest_version}", "success")
         else:
-            failed_updates.append(f"{package_name} - {output[:50]}..." if len(output) > 50 else f"{package_name} - {output}")
+            error_text = errors.get(package_name.lower().replace("_", "-"), "")
+            failed_updates.append(f"{package_name} - {error_text[:50]}..." if len(error_text) > 50 else f"{package_name} - {error_text}")
             log(f"Failed to update {package_name}", "error")
-        
-        print("─" * get_terminal_width())
-            
+
+    print(separator)
+
     # Report results
     display_summary(successful_updates, failed_updates)
     
@@ -567,32 +787,47 @@ def remove_packages() -> None:
         return
     
     # Remove selected packages
+    separator = "─" * get_terminal_width()
     print(f"\n{Colors.BOLD}REMOVING PACKAGES{Colors.RESET}")
-    print("─" * get_terminal_width())
+    print(separator)
     
     successful_removals = []
     failed_removals = []
-    
-    for idx in valid_indices:
-        package_name = packages[idx-1]["name"]
-        
-        log(f"Removing package: {package_name}", "processing")
-        
-        success, output = remove_package(package_name, pip_cmd)
-        
-        if success:
+
+    # Remove all selected packages with a single pip invocation
+    selected_names = [packages[idx - 1]["name"] for idx in valid_indices]
+
+    spinner = Spinner(f"Removing {len(selected_names)} package(s)")
+    spinner.start()
+
+    cmd = pip_cmd + ["uninstall", "-y"] + selected_names
+
+    result = run_command(cmd, timeout=120 + 30 * len(selected_names))
+    spinner.stop()
+    _LIST_CACHE.clear()
+
+    removed = set()
+    for line in result["stdout"].splitlines():
+        line = line.strip()
+        if line.startswith("Successfully uninstalled"):
+            name = line.split()[2].rsplit("-", 1)[0]
+            removed.add(name.lower().replace("_", "-"))
+
+    error_text = result["stderr"].strip()
+    for package_name in selected_names:
+        if package_name.lower().replace("_", "-") in removed:
             successful_removals.append(package_name)
             log(f"Successfully removed {package_name}", "success")
         else:
-            failed_removals.append(f"{package_name} - {output[:50]}..." if len(output) > 50 else f"{package_name} - {output}")
+            failed_removals.append(f"{package_name} - {error_text[:50]}..." if len(error_text) > 50 else f"{package_name} - {error_text}")
             log(f"Failed to remove {package_name}", "error")
-        
-        print("─" * get_terminal_width())
-    
+
+    print(separator)
+
     # Display summary
-    print("\n" + "─" * get_terminal_width())
+    print("\n" + separator)
     print(f"{Colors.BOLD}PACKAGE REMOVAL SUMMARY{Colors.RESET}")
-    print("─" * get_terminal_width())
+    print(separator)
     
     if successful_removals:
         print(f"\n{Colors.SUCCESS}✓ Successfully removed ({len(successful_removals)}):{Colors.RESET}")
@@ -604,7 +839,7 @@ def remove_packages() -> None:
         for pkg in failed_removals:
             print(f"  • {pkg}")
     
-    print("─" * get_terminal_width())
+    print(separator)
     wait_for_enter()
 
 
@@ -619,7 +854,7 @@ def display_menu() -> None:
     ]
     
     while True:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         print_header()
         
         print(f"\n{Colors.BOLD}MAIN MENU{Colors.RESET}")